@@ -1,24 +1,52 @@
 import os
+import sys
+import functools
+import json
+import re
+import shutil
 import time  # ← TAMBAHKAN INI
-from datetime import datetime
+from datetime import datetime, timedelta
 import secrets
-from flask import Flask, render_template, redirect, url_for, flash, request, abort, session
+import threading
+import multiprocessing
+import tracemalloc
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+import click
+from flask import Flask, render_template, redirect, url_for, flash, request, abort, session, jsonify
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import case, event, func, literal, select, text
+from sqlalchemy.orm.attributes import set_committed_value
+from flask_sqlalchemy.pagination import Pagination
 from flask_wtf import FlaskForm
+from flask_wtf.csrf import validate_csrf
 from flask_wtf.file import FileField, FileAllowed
-from wtforms import StringField, TextAreaField, SelectField, PasswordField
-from wtforms.validators import DataRequired, Length, Regexp
+from wtforms import StringField, TextAreaField, SelectField, PasswordField, BooleanField, IntegerField
+from wtforms.validators import DataRequired, Length, Regexp, ValidationError, Optional, NumberRange
+from werkzeug.routing import BaseConverter
+from werkzeug.routing import ValidationError as RouteValidationError
 from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.utils import secure_filename
 
 # Cek apakah PIL/Pillow tersedia
 try:
     from PIL import Image
+    from imaging import resize_image
     HAS_PIL = True
 except ImportError:
     HAS_PIL = False
     print("Peringatan: Pillow tidak terinstall. Gambar akan disimpan tanpa resize.")
 
+# fcntl (lock file antar proses) hanya ada di Unix; di Windows cukup lock antar thread
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 # ===================== KONFIGURASI APLIKASI =====================
 app = Flask(__name__)
 
@@ -26,22 +54,70 @@ app = Flask(__name__)
 app.config['SECRET_KEY'] = 'dev-secret-key-ubah-di-production'
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///lostfound.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-app.config['UPLOAD_FOLDER'] = 'static/uploads'
+app.config['UPLOAD_FOLDER'] = os.path.join(app.root_path, 'static', 'uploads')
 app.config['MAX_CONTENT_LENGTH'] = 2 * 1024 * 1024  # 2MB max file size
 app.config['ALLOWED_EXTENSIONS'] = {'jpg', 'jpeg', 'png'}
+app.config['CHUNK_UPLOAD_FOLDER'] = os.path.join(app.instance_path, 'chunked_uploads')
+app.config['CHUNK_UPLOAD_MAX_SIZE'] = 25 * 1024 * 1024  # total foto via upload bertahap
+app.config['CHUNK_UPLOAD_CHUNK_SIZE'] = 1024 * 1024  # harus < MAX_CONTENT_LENGTH
+app.config['CHUNK_UPLOAD_EXPIRY'] = 24 * 3600  # detik, upload yang ditinggalkan dihapus
+app.config['IMAGE_MAX_SIZE'] = (800, 800)
+app.config['IMAGE_WORKERS'] = int(os.environ.get('IMAGE_WORKERS', 2))  # ukuran process pool resize
+app.config['IMAGE_RESIZE_TIMEOUT'] = 30  # detik
+app.config['ITEMS_PER_PAGE'] = 6
+app.config['STATIC_EXPORT_FOLDER'] = os.path.join(app.root_path, 'public')  # output `flask export-static`
+app.config['BULK_CHUNK_SIZE'] = 500  # item per transaksi pada operasi massal admin
+app.config['BULK_JOB_STALE_AFTER'] = 300  # detik tanpa progress sebelum job dianggap terhenti
+app.config['READ_MODEL_ENABLED'] = os.environ.get('READ_MODEL') == '1'  # listing dari memori
+
+# Hash password per profil deployment (metode lengkap dengan parameter, format werkzeug).
+# Hash lama dengan parameter berbeda otomatis di-hash ulang saat login berhasil.
+PASSWORD_HASH_PROFILES = {
+    'default': 'pbkdf2:sha256:600000',  # default werkzeug 2.3
+    'low-cpu': 'pbkdf2:sha256:260000',  # instance kecil/free tier
+    'scrypt': 'scrypt:32768:8:1',
+}
+PASSWORD_HASH_PROFILE = os.environ.get('PASSWORD_HASH_PROFILE', 'default')
+if PASSWORD_HASH_PROFILE not in PASSWORD_HASH_PROFILES:
+    raise RuntimeError(f"PASSWORD_HASH_PROFILE '{PASSWORD_HASH_PROFILE}' tidak dikenal, "
+                       f"pilih salah satu: {', '.join(PASSWORD_HASH_PROFILES)}")
+app.config['PASSWORD_HASH_METHOD'] = os.environ.get('PASSWORD_HASH_METHOD') or \
+    PASSWORD_HASH_PROFILES[PASSWORD_HASH_PROFILE]
+# Jatah core per proses: gunicorn menjalankan beberapa worker (lihat gunicorn.conf.py),
+# jadi pool hash tiap proses hanya mendapat bagian dari total CPU
+_cpu_count = os.cpu_count() or 1
+_web_workers = int(os.environ.get('WEB_CONCURRENCY', min(_cpu_count + 1, 4)))
+app.config['PASSWORD_HASH_WORKERS'] = int(os.environ.get('PASSWORD_HASH_WORKERS',
+                                                         max(1, _cpu_count // _web_workers)))
+
+# SQLite diakses dari banyak thread (gunicorn gthread): tunggu lock, jangan langsung error
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'connect_args': {'timeout': 15, 'check_same_thread': False},
+}
 
 # Pastikan folder uploads ada
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+os.makedirs(app.config['CHUNK_UPLOAD_FOLDER'], exist_ok=True)
 
 # Inisialisasi database
 db = SQLAlchemy(app)
 
+# Mode WAL: pembaca tidak terblokir oleh penulis saat upload berjalan bersamaan
+with app.app_context():
+    @event.listens_for(db.engine, 'connect')
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        if db.engine.dialect.name == 'sqlite':
+            cursor = dbapi_connection.cursor()
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.close()
+
 # ===================== MODELS =====================
 class User(db.Model):
     """Model untuk user (admin/mahasiswa)"""
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
-    password_hash = db.Column(db.String(120), nullable=False)
+    password_hash = db.Column(db.String(255), nullable=False)
     is_admin = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
@@ -49,10 +125,15 @@ class User(db.Model):
     items = db.relationship('Item', backref='author', lazy=True)
     
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = run_password_hash(
+            generate_password_hash, password, app.config['PASSWORD_HASH_METHOD'])
     
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        return run_password_hash(check_password_hash, self.password_hash, password)
+    
+    def password_needs_rehash(self):
+        """True jika hash tersimpan memakai metode/parameter yang berbeda dari konfigurasi"""
+        return self.password_hash.split('$', 1)[0] != password_hash_prefix(app.config['PASSWORD_HASH_METHOD'])
 
 class Item(db.Model):
     """Model untuk item hilang/ditemukan"""
@@ -65,11 +146,94 @@ class Item(db.Model):
     image = db.Column(db.String(200), nullable=True)
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    claimed = db.Column(db.Boolean, nullable=False, default=False)  # sudah diambil pemiliknya
+    seq = db.Column(db.Integer, nullable=False, default=0, index=True)  # seq perubahan terakhir di ItemChange
     
     def __repr__(self):
         return f'<Item {self.name}>'
 
+class ItemChange(db.Model):
+    """Log perubahan item (append-only) untuk sinkronisasi incremental"""
+    __table_args__ = {'sqlite_autoincrement': True}  # seq tidak pernah dipakai ulang
+    seq = db.Column(db.Integer, primary_key=True)
+    item_id = db.Column(db.Integer, nullable=False, index=True)  # tanpa FK: tombstone tetap ada
+    op = db.Column(db.String(10), nullable=False)  # 'insert', 'update' atau 'delete'
+    changed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+class BulkJob(db.Model):
+    """Job operasi massal admin; progress disimpan di DB agar terbaca dari worker mana pun"""
+    id = db.Column(db.Integer, primary_key=True)
+    action = db.Column(db.String(20), nullable=False)  # 'delete', 'claim' atau 'relocate'
+    status = db.Column(db.String(20), nullable=False, default='pending')  # pending/running/done/failed
+    total = db.Column(db.Integer, nullable=False, default=0)
+    processed = db.Column(db.Integer, nullable=False, default=0)
+    affected = db.Column(db.Integer, nullable=False, default=0)
+    error = db.Column(db.Text, nullable=True)
+    # Pilihan item dan progress disimpan agar job yang terhenti (worker mati/restart)
+    # bisa dilanjutkan dari item setelah last_id
+    item_ids = db.Column(db.Text, nullable=True)  # id terurut, dipisahkan koma
+    new_location = db.Column(db.String(100), nullable=True)
+    last_id = db.Column(db.Integer, nullable=False, default=0)
+    heartbeat_at = db.Column(db.DateTime, nullable=True)
+    created_by = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    
+    def remaining_ids(self):
+        """Id item yang belum diproses"""
+        return [int(part) for part in (self.item_ids or '').split(',')
+                if part and int(part) > self.last_id]
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'action': self.action,
+            'status': self.status,
+            'total': self.total,
+            'processed': self.processed,
+            'affected': self.affected,
+            'error': self.error,
+        }
+
+@event.listens_for(db.session, 'after_flush')
+def record_item_changes(session, flush_context):
+    """Tulis change log untuk setiap item yang berubah, di transaksi yang sama"""
+    # Di after_flush koleksi new/dirty/deleted masih berisi keadaan sebelum flush,
+    # tapi id item baru sudah terisi dan transaksi sudah memegang write lock
+    changes = [(obj, 'insert') for obj in session.new if isinstance(obj, Item)]
+    changes += [(obj, 'update') for obj in session.dirty
+                if isinstance(obj, Item) and session.is_modified(obj)]
+    changes += [(obj, 'delete') for obj in session.deleted if isinstance(obj, Item)]
+    if not changes:
+        return
+    
+    connection = session.connection()
+    now = datetime.utcnow()
+    for obj, op in changes:
+        result = connection.execute(
+            ItemChange.__table__.insert().values(item_id=obj.id, op=op, changed_at=now))
+        seq = result.inserted_primary_key[0]
+        if op != 'delete':
+            connection.execute(
+                Item.__table__.update().where(Item.__table__.c.id == obj.id).values(seq=seq))
+            set_committed_value(obj, 'seq', seq)
+
 # ===================== FORMS =====================
+LOCATION_CHOICES = [
+    ('', 'Pilih Lokasi'),
+    ('gedung_a', 'Gedung A - Fakultas Teknik'),
+    ('gedung_b', 'Gedung B - Fakultas Ekonomi'),
+    ('gedung_c', 'Gedung C - Fakultas Hukum'),
+    ('perpustakaan', 'Perpustakaan Pusat'),
+    ('kantin', 'Kantin Utama'),
+    ('lab_komputer', 'Lab Komputer'),
+    ('auditorium', 'Auditorium'),
+    ('lapangan', 'Lapangan Olahraga'),
+    ('parkiran', 'Area Parkir'),
+    ('lainnya', 'Lainnya (ketik sendiri)')
+]
+
 class LoginForm(FlaskForm):
     """Form untuk login"""
     username = StringField('Username', validators=[DataRequired()])
@@ -81,19 +245,7 @@ class ItemForm(FlaskForm):
                       validators=[DataRequired()])
     name = StringField('Nama Barang', validators=[DataRequired(), Length(max=100)])
     description = TextAreaField('Deskripsi', validators=[DataRequired()])
-    location = SelectField('Lokasi', choices=[
-        ('', 'Pilih Lokasi'),
-        ('gedung_a', 'Gedung A - Fakultas Teknik'),
-        ('gedung_b', 'Gedung B - Fakultas Ekonomi'),
-        ('gedung_c', 'Gedung C - Fakultas Hukum'),
-        ('perpustakaan', 'Perpustakaan Pusat'),
-        ('kantin', 'Kantin Utama'),
-        ('lab_komputer', 'Lab Komputer'),
-        ('auditorium', 'Auditorium'),
-        ('lapangan', 'Lapangan Olahraga'),
-        ('parkiran', 'Area Parkir'),
-        ('lainnya', 'Lainnya (ketik sendiri)')
-    ], validators=[DataRequired()])
+    location = SelectField('Lokasi', choices=LOCATION_CHOICES, validators=[DataRequired()])
     contact = StringField('Nomor WhatsApp', validators=[
         DataRequired(),
         Regexp(r'^[0-9+\-\s]{10,15}$', message='Format nomor tidak valid')
@@ -102,11 +254,126 @@ class ItemForm(FlaskForm):
         FileAllowed(['jpg', 'jpeg', 'png'], 'Hanya file gambar (JPG, JPEG, PNG) yang diizinkan')
     ])
 
+class BulkActionForm(FlaskForm):
+    """Form operasi massal admin: pilih item lewat ID dan/atau filter"""
+    action = SelectField('Aksi', choices=[
+        ('delete', 'Hapus'),
+        ('claim', 'Tandai sudah diambil'),
+        ('relocate', 'Pindahkan lokasi'),
+    ], validators=[DataRequired()])
+    ids = StringField('ID Item', validators=[
+        Optional(),
+        Regexp(r'^[0-9,\s]*$', message='ID dipisahkan koma, contoh: 1, 2, 3')
+    ])
+    type = SelectField('Jenis', choices=[('', 'Semua'), ('lost', 'Barang Hilang'), ('found', 'Barang Ditemukan')],
+                       validators=[Optional()])
+    location = StringField('Lokasi (sama persis)', validators=[Optional(), Length(max=100)])
+    search = StringField('Kata kunci', validators=[Optional(), Length(max=100)])
+    older_than_days = IntegerField('Lebih lama dari (hari)', validators=[
+        Optional(),
+        NumberRange(min=0, max=36500, message='Isi 0 sampai 36500 hari')
+    ])
+    claimed = SelectField('Status', choices=[('', 'Semua'), ('no', 'Belum diambil'), ('yes', 'Sudah diambil')],
+                          validators=[Optional()])
+    new_location = SelectField('Lokasi baru', choices=LOCATION_CHOICES, validators=[Optional()])
+    dry_run = BooleanField('Dry run (hanya hitung)')
+    
+    def item_ids(self):
+        """Daftar ID dari field ids (kosong jika hanya berisi spasi/koma)"""
+        return [int(part) for part in re.split(r'[,\s]+', self.ids.data or '') if part]
+    
+    def validate_ids(self, field):
+        # SQLite INTEGER maksimal 64-bit; id lebih besar tidak mungkin ada
+        if any(item_id > 2 ** 63 - 1 for item_id in self.item_ids()):
+            raise ValidationError('ID item tidak valid')
+
 # ===================== HELPER FUNCTIONS =====================
 def allowed_file(filename):
     """Cek apakah ekstensi file diizinkan"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
 
+# Process pool untuk pekerjaan Pillow yang berat di CPU, dibuat lazy per proses
+# (setelah fork gunicorn) dan dibatasi agar antrian tidak tumbuh tanpa batas.
+# Proses pool tidak di-fork langsung dari worker gthread: fork dari proses yang
+# punya banyak thread bisa deadlock jika thread lain sedang memegang lock (mis.
+# import lock saat Pillow memuat plugin). forkserver/spawn memulai proses bersih.
+_image_pool = None
+_image_pool_lock = threading.Lock()
+_image_slots = threading.BoundedSemaphore(app.config['IMAGE_WORKERS'] * 2)
+
+def get_image_pool():
+    """Ambil (atau buat) process pool untuk resize gambar"""
+    global _image_pool
+    if _image_pool is None:
+        with _image_pool_lock:
+            if _image_pool is None:
+                method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+                _image_pool = ProcessPoolExecutor(max_workers=app.config['IMAGE_WORKERS'],
+                                                  mp_context=multiprocessing.get_context(method))
+    return _image_pool
+
+def shutdown_image_pool(wait=True):
+    """Matikan process pool gambar (dipanggil saat worker berhenti atau pool rusak)"""
+    global _image_pool
+    # Lepas pool dari lock dulu agar upload lain tidak ikut menunggu shutdown
+    with _image_pool_lock:
+        pool, _image_pool = _image_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+def process_image(filepath):
+    """Resize gambar lewat process pool, fallback ke resize langsung jika pool gagal"""
+    output_size = app.config['IMAGE_MAX_SIZE']
+    with _image_slots:
+        try:
+            future = get_image_pool().submit(resize_image, filepath, output_size)
+        except (OSError, RuntimeError) as e:
+            # Pool tidak tersedia (mis. platform tanpa multiprocessing)
+            print(f"Process pool gambar tidak tersedia, resize langsung: {e}")
+            shutdown_image_pool(wait=False)
+            return resize_image(filepath, output_size)
+        try:
+            return future.result(timeout=app.config['IMAGE_RESIZE_TIMEOUT'])
+        except FutureTimeoutError:
+            # Resize terlalu lama: tinggalkan task-nya, jangan resize ulang di request thread.
+            # (Ditangkap terpisah: di Python 3.11+ TimeoutError adalah subclass OSError)
+            future.cancel()
+            raise
+        except BrokenProcessPool as e:
+            # Proses worker mati: buang pool tanpa menunggu, pool baru dibuat di upload berikutnya
+            print(f"Process pool gambar rusak, resize langsung: {e}")
+            shutdown_image_pool(wait=False)
+            return resize_image(filepath, output_size)
+
+# Thread pool terbatas untuk hash password: hashlib melepas GIL, jadi hash berjalan
+# paralel tapi paling banyak PASSWORD_HASH_WORKERS sekaligus, sisa CPU untuk request lain
+_hash_pool = None
+_hash_pool_lock = threading.Lock()
+
+def get_hash_pool():
+    """Ambil (atau buat) thread pool untuk hash password"""
+    global _hash_pool
+    if _hash_pool is None:
+        with _hash_pool_lock:
+            if _hash_pool is None:
+                _hash_pool = ThreadPoolExecutor(max_workers=app.config['PASSWORD_HASH_WORKERS'],
+                                                thread_name_prefix='password-hash')
+    return _hash_pool
+
+@functools.lru_cache(maxsize=None)
+def password_hash_prefix(method):
+    """Awalan hash (metode lengkap dengan parameter) yang dihasilkan werkzeug untuk `method`.
+
+    Metode singkat seperti 'scrypt' atau 'pbkdf2' dilengkapi werkzeug dengan parameter
+    default, jadi dibandingkan dengan hasil hash sungguhan (dihitung sekali per metode,
+    lewat thread pool hash seperti hash password lain).
+    """
+    return run_password_hash(generate_password_hash, '', method).split('$', 1)[0]
+
+def run_password_hash(func, *args):
+    """Jalankan fungsi hash/verifikasi password di thread pool dan tunggu hasilnya"""
+    return get_hash_pool().submit(func, *args).result()
+
 def save_image(file):
     """Simpan gambar dengan nama random dan resize jika PIL tersedia"""
     if not file or file.filename == '':
@@ -123,13 +390,10 @@ def save_image(file):
             # Simpan file terlebih dahulu
             file.save(filepath)
             
-            # Resize jika PIL tersedia
+            # Resize jika PIL tersedia (di process pool, request thread hanya menunggu)
             if HAS_PIL:
                 try:
-                    output_size = (800, 800)
-                    img = Image.open(filepath)
-                    img.thumbnail(output_size)
-                    img.save(filepath)
+                    process_image(filepath)
                 except Exception as e:
                     print(f"Gagal resize gambar: {e}")
                     # Lanjutkan dengan gambar asli
@@ -144,6 +408,162 @@ def save_image(file):
         return filename
     return None
 
+# ----- Upload bertahap (resumable, mirip tus) -----
+# Foto dikirim per chunk ke /uploads sebelum form disubmit; form hanya membawa
+# upload_id. Setiap upload = <id>.part (data) + <id>.json (metadata).
+UPLOAD_ID_RE = re.compile(r'^[0-9a-f]{32}$')
+
+def upload_paths(upload_id):
+    folder = app.config['CHUNK_UPLOAD_FOLDER']
+    return os.path.join(folder, upload_id + '.part'), os.path.join(folder, upload_id + '.json')
+
+def read_upload_meta(upload_id):
+    """Baca metadata upload bertahap, None jika id tidak valid/tidak ada"""
+    if not UPLOAD_ID_RE.match(upload_id or ''):
+        return None
+    try:
+        with open(upload_paths(upload_id)[1]) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_upload_meta(upload_id, meta):
+    meta_path = upload_paths(upload_id)[1]
+    with open(meta_path + '.tmp', 'w') as f:
+        json.dump(meta, f)
+    os.replace(meta_path + '.tmp', meta_path)
+
+def remove_upload(upload_id):
+    for path in upload_paths(upload_id):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+_upload_lock = threading.Lock()
+
+@contextmanager
+def locked_upload_part(upload_id):
+    """Buka file .part upload dengan lock eksklusif (antar thread dan antar worker gunicorn).
+
+    Menghasilkan None jika file sudah tidak ada (upload sudah difinalisasi/dihapus).
+    Pemanggil harus membaca ulang metadata setelah lock didapat.
+    """
+    part_path, _ = upload_paths(upload_id)
+    try:
+        fd = os.open(part_path, os.O_WRONLY | os.O_APPEND)
+    except FileNotFoundError:
+        yield None
+        return
+    with os.fdopen(fd, 'ab') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            yield f
+        else:
+            with _upload_lock:
+                yield f
+
+def get_upload_or_404(upload_id):
+    """Metadata upload milik user yang sedang login"""
+    meta = read_upload_meta(upload_id)
+    if meta is None:
+        abort(404)
+    if meta['user_id'] != session.get('user_id'):
+        abort(403)
+    return meta
+
+def cleanup_stale_uploads():
+    """Hapus upload bertahap yang tidak diselesaikan/dipakai dalam CHUNK_UPLOAD_EXPIRY"""
+    cutoff = time.time() - app.config['CHUNK_UPLOAD_EXPIRY']
+    for name in os.listdir(app.config['CHUNK_UPLOAD_FOLDER']):
+        upload_id, ext = os.path.splitext(name)
+        if ext != '.json':
+            continue
+        path = os.path.join(app.config['CHUNK_UPLOAD_FOLDER'], name)
+        if os.path.getmtime(path) >= cutoff:
+            continue
+        meta = read_upload_meta(upload_id)
+        # Gambar yang sudah difinalisasi tapi tidak pernah dipakai item juga dihapus
+        if meta and meta.get('image'):
+            image_path = os.path.join(app.config['UPLOAD_FOLDER'], meta['image'])
+            if os.path.exists(image_path):
+                os.remove(image_path)
+        remove_upload(upload_id)
+
+def claim_upload(upload_id):
+    """Ambil nama file gambar hasil upload bertahap milik user ini (sekali pakai)"""
+    meta = read_upload_meta(upload_id)
+    if not meta or meta['user_id'] != session.get('user_id') or not meta.get('image'):
+        return None
+    # Hapus metadata = klaim atomik: jika dua submit memakai upload_id yang sama
+    # (mis. klik ganda), hanya satu yang berhasil menghapus dan mendapat gambarnya
+    try:
+        os.remove(upload_paths(upload_id)[1])
+    except FileNotFoundError:
+        return None
+    return meta['image']
+
+def get_uploaded_image(form):
+    """Simpan gambar dari field file biasa, atau ambil dari upload bertahap (upload_id)"""
+    if form.image.data:
+        return save_image(form.image.data)
+    upload_id = request.form.get('upload_id')
+    if upload_id:
+        return claim_upload(upload_id)
+    return None
+
+def item_to_dict(item):
+    """Data publik item untuk respons JSON (delta sync dan ekspor statis)"""
+    return {
+        'type': item.type,
+        'name': item.name,
+        'description': item.description,
+        'location': item.location,
+        'contact': item.contact,
+        'image': url_for('static', filename='uploads/' + item.image) if item.image else None,
+        'timestamp': item.timestamp.isoformat(),
+        'updated_at': item.updated_at.isoformat() if item.updated_at else None,
+        'claimed': item.claimed,
+    }
+
+class LocationConverter(BaseConverter):
+    """Lokasi sebagai satu segmen path yang aman jadi nama folder ekspor statis.
+
+    Lokasi bisa diketik bebas ("lainnya"), jadi selain huruf, angka, '_' dan '-' setiap
+    byte UTF-8 ditulis sebagai ~XX (hex). Hasilnya tidak pernah berisi '/', '.' atau '%'
+    sehingga tidak bisa keluar dari folder list/<type>/location/ saat diekspor.
+    """
+    regex = r'(?:[A-Za-z0-9_\-]|~[0-9A-F]{2})+'
+    
+    def to_python(self, value):
+        try:
+            return re.sub(rb'~([0-9A-F]{2})', lambda m: bytes.fromhex(m.group(1).decode()),
+                          value.encode()).decode('utf-8')
+        except UnicodeDecodeError:
+            raise RouteValidationError()
+    
+    def to_url(self, value):
+        return location_slug(value)
+
+def location_slug(location):
+    """Segmen path untuk lokasi (lihat LocationConverter)"""
+    return ''.join(chr(byte) if chr(byte).isascii() and (chr(byte).isalnum() or chr(byte) in '_-')
+                   else f'~{byte:02X}' for byte in location.encode('utf-8'))
+
+app.url_map.converters['location'] = LocationConverter
+
+@app.template_global()
+def list_url(type, page=1, search='', location=''):
+    """URL halaman daftar. Tanpa pencarian, halaman & lokasi ada di path agar bisa diekspor statis"""
+    args = {'type': type}
+    if page and page > 1:
+        args['page'] = page
+    if location:
+        args['location'] = location
+    if search:
+        args['search'] = search
+    return url_for('list_items', **args)
+
 def get_location_value(form_location, request_form):
     """Ambil nilai lokasi dari form (bisa dari select atau input custom)"""
     # Debug: print request form untuk melihat data yang diterima
@@ -176,11 +596,309 @@ def get_location_value(form_location, request_form):
         }
         return location_map.get(form_location, form_location)
 
+# ----- Operasi massal admin -----
+def bulk_selection(form):
+    """Query id item yang cocok dengan ID dan/atau filter di form"""
+    query = db.session.query(Item.id)
+    ids = form.item_ids()
+    if ids:
+        query = query.filter(Item.id.in_(ids))
+    if form.type.data:
+        query = query.filter(Item.type == form.type.data)
+    if form.location.data:
+        query = query.filter(Item.location == form.location.data)
+    if form.search.data:
+        query = query.filter(Item.name.contains(form.search.data) |
+                             Item.description.contains(form.search.data))
+    if form.older_than_days.data is not None:
+        query = query.filter(Item.timestamp < datetime.utcnow() - timedelta(days=form.older_than_days.data))
+    if form.claimed.data:
+        query = query.filter(Item.claimed == (form.claimed.data == 'yes'))
+    return query.order_by(Item.id)
+
+def log_item_changes(item_ids, op):
+    """Tulis change log untuk perubahan lewat SQL langsung (tidak melewati event ORM).
+
+    Satu INSERT ... SELECT per chunk; seq tetap dari AUTOINCREMENT. Untuk 'delete'
+    harus dipanggil sebelum DELETE karena id diambil dari tabel item.
+    """
+    if not item_ids:
+        return
+    item = Item.__table__
+    db.session.execute(ItemChange.__table__.insert().from_select(
+        ['item_id', 'op', 'changed_at'],
+        select(item.c.id, literal(op), literal(datetime.utcnow()))
+        .where(item.c.id.in_(item_ids)).order_by(item.c.id)))
+    if op != 'delete':
+        latest = select(func.max(ItemChange.seq)).where(ItemChange.item_id == item.c.id).scalar_subquery()
+        db.session.execute(item.update().where(item.c.id.in_(item_ids)).values(seq=latest))
+
+def apply_bulk_chunk(action, item_ids, new_location=None):
+    """Jalankan satu chunk operasi massal sebagai SQL set-based; kembalikan (jumlah, gambar)"""
+    table = Item.__table__
+    rows = db.session.query(Item.id, Item.image).filter(Item.id.in_(item_ids)).all()
+    existing = [row.id for row in rows]
+    if not existing:
+        return 0, []
+    
+    if action == 'delete':
+        log_item_changes(existing, 'delete')
+        db.session.execute(table.delete().where(table.c.id.in_(existing)))
+        return len(existing), [row.image for row in rows if row.image]
+    
+    values = {'claimed': True} if action == 'claim' else {'location': new_location}
+    db.session.execute(table.update().where(table.c.id.in_(existing))
+                       .values(updated_at=datetime.utcnow(), **values))
+    log_item_changes(existing, 'update')
+    return len(existing), []
+
+def remove_image_files(filenames):
+    """Hapus file gambar (dipanggil setelah commit, file yang hilang diabaikan)"""
+    for filename in filenames:
+        try:
+            os.remove(os.path.join(app.config['UPLOAD_FOLDER'], filename))
+        except FileNotFoundError:
+            pass
+
+def run_bulk_job(job_id):
+    """Proses job massal per chunk: tiap chunk satu transaksi bersama progress-nya,
+    jadi job yang terhenti bisa dilanjutkan dari last_id tanpa memproses ulang"""
+    with app.app_context():
+        job = db.session.get(BulkJob, job_id)
+        job.status = 'running'
+        job.heartbeat_at = datetime.utcnow()
+        db.session.commit()
+        action = job.action
+        new_location = job.new_location
+        item_ids = job.remaining_ids()
+        chunk_size = app.config['BULK_CHUNK_SIZE']
+        try:
+            for start in range(0, len(item_ids), chunk_size):
+                chunk = item_ids[start:start + chunk_size]
+                affected, images = apply_bulk_chunk(action, chunk, new_location)
+                db.session.query(BulkJob).filter_by(id=job_id).update({
+                    'processed': BulkJob.processed + len(chunk),
+                    'affected': BulkJob.affected + affected,
+                    'last_id': chunk[-1],
+                    'heartbeat_at': datetime.utcnow(),
+                })
+                db.session.commit()
+                remove_image_files(images)
+            db.session.query(BulkJob).filter_by(id=job_id).update(
+                {'status': 'done', 'finished_at': datetime.utcnow()})
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            app.logger.error(f'Bulk job {job_id} error: {str(e)}')
+            db.session.query(BulkJob).filter_by(id=job_id).update(
+                {'status': 'failed', 'error': str(e), 'finished_at': datetime.utcnow()})
+            db.session.commit()
+
+def claim_stale_bulk_jobs():
+    """Klaim job pending/running yang tidak ada progress selama BULK_JOB_STALE_AFTER detik
+    (thread/worker pemrosesnya mati). Kembalikan id job yang berhasil diklaim."""
+    cutoff = datetime.utcnow() - timedelta(seconds=app.config['BULK_JOB_STALE_AFTER'])
+    stale = (BulkJob.status.in_(['pending', 'running']) &
+             (func.coalesce(BulkJob.heartbeat_at, BulkJob.created_at) < cutoff))
+    claimed = []
+    for (job_id,) in db.session.query(BulkJob.id).filter(stale).all():
+        # UPDATE bersyarat: jika beberapa worker melihat job yang sama, hanya satu yang menang
+        if BulkJob.query.filter(BulkJob.id == job_id, stale).update(
+                {'heartbeat_at': datetime.utcnow()}, synchronize_session=False):
+            claimed.append(job_id)
+    db.session.commit()
+    return claimed
+
+def resume_stale_bulk_jobs():
+    """Lanjutkan job yang terhenti di background thread"""
+    for job_id in claim_stale_bulk_jobs():
+        app.logger.warning(f'Bulk job {job_id} terhenti, dilanjutkan')
+        threading.Thread(target=run_bulk_job, args=(job_id,), daemon=True).start()
+
+# ===================== READ MODEL =====================
+# Salinan ringkas field listing di memori proses, agar index/list_items tidak
+# perlu query + hidrasi objek ORM (termasuk deskripsi penuh) di setiap request.
+# Aktifkan dengan READ_MODEL=1. Diperbarui incremental dari change log (ItemChange).
+LISTING_DESCRIPTION_LENGTH = 101  # template memotong di 100 karakter + '...'
+EPOCH = datetime(1970, 1, 1)
+
+class ListingRecord:
+    """Record ringkas satu item untuk kartu listing"""
+    __slots__ = ('id', 'type', 'name', 'description', 'location', 'timestamp', 'image',
+                 'claimed', 'seq')
+    
+    def __init__(self, id, type, name, description, location, timestamp, image, claimed, seq):
+        self.id = id
+        self.type = type
+        self.name = name
+        self.description = description
+        self.location = location  # string kanonik milik read model (satu objek per lokasi)
+        self.timestamp = timestamp
+        self.image = image
+        self.claimed = claimed
+        self.seq = seq
+    
+    @property
+    def sort_key(self):
+        # Mikrodetik sejak epoch, disimpan di array('q') agar ringkas
+        return (self.timestamp - EPOCH) // timedelta(microseconds=1)
+
+class RecordPagination(Pagination):
+    """Pagination di atas list record (urutan terbaru dulu), kompatibel dengan template"""
+    
+    def _query_items(self):
+        records = self._query_args['records']
+        end = len(records) - self._query_offset
+        start = max(end - self.per_page, 0)
+        return records[start:end][::-1] if end > 0 else []
+    
+    def _query_count(self):
+        return len(self._query_args['records'])
+
+class SortedRecords:
+    """Record terurut naik berdasarkan timestamp, dengan kunci di array('q')"""
+    __slots__ = ('keys', 'records')
+    
+    def __init__(self):
+        self.keys = array('q')
+        self.records = []
+    
+    def insert(self, record):
+        key = record.sort_key
+        pos = bisect_right(self.keys, key)
+        self.keys.insert(pos, key)
+        self.records.insert(pos, record)
+    
+    def remove(self, record):
+        pos = bisect_left(self.keys, record.sort_key)
+        while self.records[pos] is not record:
+            pos += 1
+        del self.keys[pos]
+        del self.records[pos]
+
+class ItemReadModel:
+    """Read model item per proses: terurut per tipe dan per (tipe, lokasi)"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.records = {}          # id -> ListingRecord
+        self.lists = {}            # (type, lokasi atau None) -> SortedRecords
+        self.locations = {}        # nama lokasi -> string kanonik (dipakai bersama semua record)
+        self.location_counts = {}  # nama lokasi -> jumlah item
+        self.last_seq = 0
+    
+    def clear(self):
+        self.records.clear()
+        self.lists.clear()
+        self.location_counts.clear()
+        self.last_seq = 0
+    
+    def location(self, name):
+        """String lokasi kanonik, agar 100k record tidak menyimpan salinan nama yang sama"""
+        return self.locations.setdefault(name, name)
+    
+    def _lists_for(self, record):
+        for key in ((record.type, None), (record.type, record.location)):
+            sorted_records = self.lists.get(key)
+            if sorted_records is None:
+                sorted_records = self.lists[key] = SortedRecords()
+            yield sorted_records
+    
+    def _remove(self, record):
+        for sorted_records in self._lists_for(record):
+            sorted_records.remove(record)
+        self.location_counts[record.location] -= 1
+        del self.records[record.id]
+    
+    def load(self, rows):
+        """Muat semua record sekaligus (sort sekali, bukan insert satu per satu)"""
+        self.clear()
+        for id, type, name, description, location, timestamp, image, claimed, seq in rows:
+            record = ListingRecord(id, sys.intern(type), name, description,
+                                   self.location(location), timestamp, image, claimed, seq)
+            for sorted_records in self._lists_for(record):
+                sorted_records.records.append(record)
+            self.location_counts[record.location] = self.location_counts.get(record.location, 0) + 1
+            self.records[id] = record
+        for sorted_records in self.lists.values():
+            sorted_records.records.sort(key=lambda record: record.sort_key)
+            sorted_records.keys = array('q', (record.sort_key for record in sorted_records.records))
+    
+    def apply(self, rows):
+        """Masukkan/perbarui record dari baris (kolom sesuai LISTING_COLUMNS)"""
+        for id, type, name, description, location, timestamp, image, claimed, seq in rows:
+            old = self.records.get(id)
+            if old is not None:
+                self._remove(old)
+            record = ListingRecord(id, sys.intern(type), name, description,
+                                   self.location(location), timestamp, image, claimed, seq)
+            for sorted_records in self._lists_for(record):
+                sorted_records.insert(record)
+            self.location_counts[record.location] = self.location_counts.get(record.location, 0) + 1
+            self.records[id] = record
+    
+    def refresh(self):
+        """Terapkan perubahan dari change log sejak last_seq"""
+        latest = db.session.query(func.max(ItemChange.seq)).scalar() or 0
+        with self.lock:
+            if latest == self.last_seq:
+                return
+            if self.last_seq == 0:
+                self.load(listing_rows())
+            else:
+                deleted = db.session.query(ItemChange.item_id).filter(
+                    ItemChange.seq > self.last_seq, ItemChange.op == 'delete')
+                for (item_id,) in deleted:
+                    record = self.records.get(item_id)
+                    if record is not None:
+                        self._remove(record)
+                self.apply(listing_rows(Item.seq > self.last_seq))
+            self.last_seq = latest
+    
+    def listing(self, type, location=None, page=1, per_page=6):
+        """Pagination item terbaru untuk satu tipe, opsional filter nama lokasi"""
+        with self.lock:
+            sorted_records = self.lists.get((type, location or None))
+            records = sorted_records.records if sorted_records else []
+            return RecordPagination(page=page, per_page=per_page, error_out=False, records=records)
+    
+    def latest(self, type, limit):
+        with self.lock:
+            sorted_records = self.lists.get((type, None))
+            return sorted_records.records[:-limit - 1:-1] if sorted_records else []
+    
+    def location_choices(self):
+        with self.lock:
+            return [name for name, count in self.location_counts.items() if count]
+
+LISTING_COLUMNS = (Item.id, Item.type, Item.name,
+                   func.substr(Item.description, 1, LISTING_DESCRIPTION_LENGTH),
+                   Item.location, Item.timestamp, Item.image, Item.claimed, Item.seq)
+
+def listing_rows(*criteria):
+    """Ambil kolom listing saja (tanpa objek ORM) sebagai tuple"""
+    return db.session.query(*LISTING_COLUMNS).filter(*criteria).order_by(Item.seq).all()
+
+read_model = ItemReadModel()
+
+def get_read_model():
+    """Read model yang sudah diperbarui, atau None jika tidak diaktifkan"""
+    if not app.config['READ_MODEL_ENABLED']:
+        return None
+    read_model.refresh()
+    return read_model
+
 # ===================== ROUTES =====================
 @app.route('/')
 def index():
     """Halaman utama"""
     # Ambil 6 item terbaru dari masing-masing tipe
+    model = get_read_model()
+    if model is not None:
+        return render_template('index.html',
+                             lost_items=model.latest('lost', 3),
+                             found_items=model.latest('found', 3))
+    
     lost_items = Item.query.filter_by(type='lost').order_by(Item.timestamp.desc()).limit(3).all()
     found_items = Item.query.filter_by(type='found').order_by(Item.timestamp.desc()).limit(3).all()
     
@@ -197,6 +915,11 @@ def login():
         user = User.query.filter_by(username=form.username.data).first()
         
         if user and user.check_password(form.password.data):
+            # Perbarui hash lama ke parameter saat ini (password asli hanya ada sekarang)
+            if user.password_needs_rehash():
+                user.set_password(form.password.data)
+                db.session.commit()
+            
             # Simpan user di session
             session['user_id'] = user.id
             session['username'] = user.username
@@ -227,11 +950,6 @@ def add_item():
     form = ItemForm()
     
     if form.validate_on_submit():
-        # Simpan gambar jika ada
-        image_filename = None
-        if form.image.data:
-            image_filename = save_image(form.image.data)
-        
         # Ambil nilai lokasi (bisa dari select atau input custom)
         location_value = get_location_value(form.location.data, request.form)
         
@@ -248,6 +966,10 @@ def add_item():
             flash('Harap pilih atau isi lokasi.', 'danger')
             return render_template('add_item.html', form=form)
         
+        # Simpan gambar setelah semua validasi lolos (upload langsung atau upload
+        # bertahap), agar form yang ditampilkan ulang tidak meninggalkan file yatim
+        image_filename = get_uploaded_image(form)
+        
         # Buat item baru
         new_item = Item(
             type=form.type.data,
@@ -268,15 +990,29 @@ def add_item():
     return render_template('add_item.html', form=form)
 
 @app.route('/list/<string:type>')
-def list_items(type):
+@app.route('/list/<string:type>/page/<int:page>')
+@app.route('/list/<string:type>/location/<location:location>')
+@app.route('/list/<string:type>/page/<int:page>/location/<location:location>')
+def list_items(type, page=None, location=None):
     """List items dengan filter dan pagination"""
     if type not in ['lost', 'found']:
         abort(404)
     
-    # Ambil parameter filter
-    page = request.args.get('page', 1, type=int)
+    # Ambil parameter filter (dari path, atau query string untuk URL lama/form filter)
+    page = page or request.args.get('page', 1, type=int)
     search = request.args.get('search', '')
-    location_filter = request.args.get('location', '')
+    location_filter = location or request.args.get('location', '')
+    
+    # Read model tidak menyimpan deskripsi penuh, jadi pencarian tetap ke database
+    model = get_read_model()
+    if model is not None and not search:
+        return render_template('list_items.html',
+                             items=model.listing(type, location_filter, page=page,
+                                                 per_page=app.config['ITEMS_PER_PAGE']),
+                             type=type,
+                             search=search,
+                             location_filter=location_filter,
+                             location_choices=model.location_choices())
     
     # Query dasar
     query = Item.query.filter_by(type=type)
@@ -290,7 +1026,8 @@ def list_items(type):
         query = query.filter_by(location=location_filter)
     
     # Pagination
-    items = query.order_by(Item.timestamp.desc()).paginate(page=page, per_page=6, error_out=False)
+    items = query.order_by(Item.timestamp.desc()).paginate(
+        page=page, per_page=app.config['ITEMS_PER_PAGE'], error_out=False)
     
     # Ambil semua lokasi unik untuk dropdown filter
     locations = db.session.query(Item.location).distinct().all()
@@ -328,16 +1065,6 @@ def edit_item(item_id):
     
     if form.validate_on_submit():
         try:
-            # Simpan gambar jika ada
-            image_filename = item.image  # Pertahankan gambar lama default
-            if form.image.data:
-                image_filename = save_image(form.image.data)
-                # Hapus gambar lama jika ada gambar baru
-                if item.image and item.image != image_filename:
-                    old_image_path = os.path.join(app.config['UPLOAD_FOLDER'], item.image)
-                    if os.path.exists(old_image_path):
-                        os.remove(old_image_path)
-            
             # Ambil nilai lokasi (bisa dari select atau input custom)
             location_value = get_location_value(form.location.data, request.form)
             
@@ -354,6 +1081,18 @@ def edit_item(item_id):
                 flash('Harap pilih atau isi lokasi.', 'danger')
                 return render_template('edit.html', form=form, item=item)
             
+            # Simpan gambar setelah semua validasi lolos, agar upload bertahap tidak
+            # terpakai oleh form yang ditampilkan ulang
+            image_filename = item.image  # Pertahankan gambar lama default
+            new_image = get_uploaded_image(form)
+            if new_image:
+                image_filename = new_image
+                # Hapus gambar lama jika ada gambar baru
+                if item.image and item.image != image_filename:
+                    old_image_path = os.path.join(app.config['UPLOAD_FOLDER'], item.image)
+                    if os.path.exists(old_image_path):
+                        os.remove(old_image_path)
+            
             # Update item
             item.type = form.type.data
             item.name = form.type.data.capitalize() + ': ' + form.name.data
@@ -395,6 +1134,254 @@ def delete_item(item_id):
     flash('Item berhasil dihapus!', 'success')
     return redirect(url_for('list_items', type=item.type))
 
+@app.route('/changes')
+def changes():
+    """Delta perubahan item sejak seq tertentu (JSON) untuk sinkronisasi incremental"""
+    since = request.args.get('since', 0, type=int)
+    limit = min(request.args.get('limit', 500, type=int), 1000)
+    if since < 0 or limit < 1:
+        return jsonify(error='since dan limit harus bilangan positif'), 400
+    
+    entries = ItemChange.query.filter(ItemChange.seq > since) \
+        .order_by(ItemChange.seq).limit(limit + 1).all()
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+    
+    # Ringkas: hanya perubahan terakhir per item, data diambil dari keadaan saat ini
+    latest = {}
+    for entry in entries:
+        latest[entry.item_id] = entry
+    live_ids = [item_id for item_id, entry in latest.items() if entry.op != 'delete']
+    items = {item.id: item for item in Item.query.filter(Item.id.in_(live_ids))} if live_ids else {}
+    
+    deltas = []
+    for item_id, entry in sorted(latest.items(), key=lambda pair: pair[1].seq):
+        item = items.get(item_id)
+        if item is None:
+            # Dihapus (atau dihapus setelah halaman ini): kirim tombstone
+            deltas.append({'seq': entry.seq, 'op': 'delete', 'id': item_id})
+            continue
+        deltas.append({
+            'seq': entry.seq,
+            'op': entry.op,
+            'id': item.id,
+            'item': item_to_dict(item),
+        })
+    
+    return jsonify(since=since,
+                   next=entries[-1].seq if entries else since,
+                   has_more=has_more,
+                   changes=deltas)
+
+# ----- Upload bertahap -----
+def check_upload_request():
+    """Upload bertahap butuh login dan token CSRF di header X-CSRFToken"""
+    if 'user_id' not in session:
+        abort(401)
+    try:
+        validate_csrf(request.headers.get('X-CSRFToken'))
+    except ValidationError:
+        abort(400)
+
+@app.route('/uploads', methods=['POST'])
+def create_upload():
+    """Mulai upload bertahap: kembalikan id upload dan offset awal"""
+    check_upload_request()
+    data = request.get_json(silent=True) or {}
+    filename = secure_filename(str(data.get('filename', '')))
+    try:
+        length = int(data.get('length', 0))
+    except (TypeError, ValueError):
+        length = 0
+    
+    if not allowed_file(filename):
+        return jsonify(error='Hanya file gambar (JPG, JPEG, PNG) yang diizinkan'), 400
+    if length <= 0:
+        return jsonify(error='Ukuran file tidak valid'), 400
+    if length > app.config['CHUNK_UPLOAD_MAX_SIZE']:
+        return jsonify(error='Ukuran file terlalu besar'), 413
+    
+    cleanup_stale_uploads()
+    upload_id = secrets.token_hex(16)
+    part_path, _ = upload_paths(upload_id)
+    open(part_path, 'wb').close()
+    write_upload_meta(upload_id, {
+        'user_id': session['user_id'],
+        'filename': filename,
+        'length': length,
+        'image': None,
+    })
+    
+    return jsonify(id=upload_id, offset=0, length=length,
+                   chunk_size=app.config['CHUNK_UPLOAD_CHUNK_SIZE']), 201, \
+        {'Location': url_for('upload_status', upload_id=upload_id)}
+
+@app.route('/uploads/<upload_id>', methods=['GET', 'HEAD'])
+def upload_status(upload_id):
+    """Offset saat ini, untuk melanjutkan upload setelah koneksi putus"""
+    if 'user_id' not in session:
+        abort(401)
+    meta = get_upload_or_404(upload_id)
+    offset = os.path.getsize(upload_paths(upload_id)[0]) if not meta['image'] else meta['length']
+    return jsonify(id=upload_id, offset=offset, length=meta['length'], image=meta['image']), 200, \
+        {'Upload-Offset': str(offset), 'Upload-Length': str(meta['length']), 'Cache-Control': 'no-store'}
+
+@app.route('/uploads/<upload_id>', methods=['PATCH'])
+def upload_chunk(upload_id):
+    """Tambahkan satu chunk di offset Upload-Offset, ditulis streaming ke file sementara"""
+    check_upload_request()
+    get_upload_or_404(upload_id)
+    
+    # Cek offset dan append dalam satu lock: dua PATCH bersamaan (retry klien) tidak
+    # boleh sama-sama lolos cek offset lalu menulis chunk yang sama dua kali
+    with locked_upload_part(upload_id) as f:
+        meta = read_upload_meta(upload_id)
+        if meta is None:
+            abort(404)
+        if meta['image']:
+            return jsonify(error='Upload sudah selesai', offset=meta['length']), 409
+        if f is None:
+            abort(404)
+        
+        current = os.fstat(f.fileno()).st_size
+        offset = request.headers.get('Upload-Offset', type=int)
+        if offset != current:
+            # Klien harus mengambil offset terbaru (GET/HEAD) lalu melanjutkan dari sana
+            return jsonify(error='Offset tidak cocok', offset=current), 409, {'Upload-Offset': str(current)}
+        
+        while True:
+            chunk = request.stream.read(64 * 1024)
+            if not chunk:
+                break
+            if current + len(chunk) > meta['length']:
+                return jsonify(error='Data melebihi ukuran file', offset=current), 413, \
+                    {'Upload-Offset': str(current)}
+            f.write(chunk)
+            current += len(chunk)
+    
+    return jsonify(offset=current), 200, {'Upload-Offset': str(current)}
+
+@app.route('/uploads/<upload_id>/finalize', methods=['POST'])
+def finalize_upload(upload_id):
+    """Pindahkan file lengkap ke folder uploads lalu jalankan pipeline gambar (resize)"""
+    check_upload_request()
+    meta = get_upload_or_404(upload_id)
+    if meta['image']:
+        # Finalize diulang (mis. respons sebelumnya hilang): kembalikan hasil yang sama
+        return jsonify(id=upload_id, image=meta['image'])
+    
+    # Lock dipegang sampai metadata ditulis, agar PATCH/finalize yang menunggu
+    # melihat upload sudah selesai
+    with locked_upload_part(upload_id) as f:
+        meta = read_upload_meta(upload_id)
+        if meta is None:
+            abort(404)
+        if meta['image']:
+            return jsonify(id=upload_id, image=meta['image'])
+        if f is None:
+            abort(404)
+        
+        size = os.fstat(f.fileno()).st_size
+        if size != meta['length']:
+            return jsonify(error='Upload belum lengkap', offset=size), 409, {'Upload-Offset': str(size)}
+        
+        _, f_ext = os.path.splitext(meta['filename'])
+        filename = secrets.token_hex(8) + f_ext.lower()
+        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+        shutil.move(upload_paths(upload_id)[0], filepath)
+        
+        if HAS_PIL:
+            try:
+                with Image.open(filepath) as img:
+                    img.verify()
+            except Exception:
+                os.remove(filepath)
+                remove_upload(upload_id)
+                return jsonify(error='File bukan gambar yang valid'), 400
+            try:
+                process_image(filepath)
+            except Exception as e:
+                print(f"Gagal resize gambar: {e}")
+        
+        meta['image'] = filename
+        write_upload_meta(upload_id, meta)
+    return jsonify(id=upload_id, image=filename)
+
+# ----- Operasi massal admin -----
+def wants_json():
+    return request.is_json or request.accept_mimetypes.best == 'application/json'
+
+@app.route('/admin/bulk', methods=['GET', 'POST'])
+def admin_bulk():
+    """Operasi massal admin: hapus, tandai diambil, atau pindahkan lokasi banyak item"""
+    if not session.get('is_admin'):
+        abort(403)
+    
+    resume_stale_bulk_jobs()
+    form = BulkActionForm()
+    preview = None
+    job = None
+    
+    if form.validate_on_submit():
+        # ID dihitung dari hasil parse: field berisi spasi/koma saja bukan filter
+        has_filter = any([form.item_ids(), form.type.data, form.location.data, form.search.data,
+                          form.older_than_days.data is not None, form.claimed.data])
+        new_location = get_location_value(form.new_location.data, request.form)
+        error = None
+        if not has_filter:
+            error = 'Pilih item dengan ID atau minimal satu filter.'
+        elif form.action.data == 'relocate' and not new_location:
+            error = 'Harap pilih atau isi lokasi baru.'
+        if error:
+            if wants_json():
+                return jsonify(error=error), 400
+            flash(error, 'danger')
+        elif form.dry_run.data:
+            selection = bulk_selection(form)
+            total, lost, images = selection.order_by(None).with_entities(
+                func.count(Item.id),
+                func.coalesce(func.sum(case((Item.type == 'lost', 1), else_=0)), 0),
+                func.count(Item.image)).one()
+            preview = {
+                'total': total,
+                'lost': lost,
+                'found': total - lost,
+                'images': images,
+                'sample_ids': [item_id for (item_id,) in selection.limit(50)],
+            }
+            if wants_json():
+                return jsonify(dry_run=True, action=form.action.data, **preview)
+        else:
+            item_ids = [item_id for (item_id,) in bulk_selection(form)]
+            job = BulkJob(action=form.action.data, total=len(item_ids),
+                          item_ids=','.join(map(str, item_ids)), new_location=new_location,
+                          created_by=session['user_id'])
+            db.session.add(job)
+            db.session.commit()
+            
+            # Job kecil langsung diproses, job besar di background thread. Jika thread
+            # mati di tengah jalan, job dilanjutkan oleh resume_stale_bulk_jobs
+            # (dipanggil saat halaman admin dibuka) atau `flask resume-bulk-jobs`
+            if len(item_ids) <= app.config['BULK_CHUNK_SIZE']:
+                run_bulk_job(job.id)
+            else:
+                threading.Thread(target=run_bulk_job, args=(job.id,), daemon=True).start()
+            db.session.refresh(job)
+            if wants_json():
+                return jsonify(job.to_dict()), 202, {'Location': url_for('admin_bulk_job', job_id=job.id)}
+    elif form.errors and wants_json():
+        return jsonify(error='Form tidak valid', fields=form.errors), 400
+    
+    recent_jobs = BulkJob.query.order_by(BulkJob.id.desc()).limit(10).all()
+    return render_template('admin_bulk.html', form=form, preview=preview, job=job, recent_jobs=recent_jobs)
+
+@app.route('/admin/bulk/jobs/<int:job_id>')
+def admin_bulk_job(job_id):
+    """Progress job operasi massal (JSON)"""
+    if not session.get('is_admin'):
+        abort(403)
+    return jsonify(db.get_or_404(BulkJob, job_id).to_dict())
+
 # ===================== ERROR HANDLERS =====================
 @app.errorhandler(404)
 def not_found_error(error):
@@ -404,11 +1391,297 @@ def not_found_error(error):
 def forbidden_error(error):
     return render_template('403.html'), 403
 
+# ===================== CLI =====================
+@app.cli.command('readmodel-stats')
+def readmodel_stats():
+    """Ukur memori dan kecepatan read model untuk 100 ribu item sintetis"""
+    n = 100_000
+    locations = [label for value, label in LOCATION_CHOICES if value not in ('', 'lainnya')]
+    now = datetime.utcnow()
+    
+    def make_rows():
+        return [(i, 'lost' if i % 2 else 'found', f'Lost: Barang contoh {i}',
+                 f'Deskripsi barang contoh nomor {i} ' * 4,
+                 locations[i % len(locations)], now - timedelta(minutes=n - i),
+                 f'{i:016x}.jpg', False, i)
+                for i in range(1, n + 1)]
+    
+    model = ItemReadModel()
+    rows = make_rows()
+    started = time.perf_counter()
+    model.load(rows)
+    print(f'{n} item dimuat dalam {time.perf_counter() - started:.2f}s')
+    
+    # Ukur ulang dengan tracemalloc; baris dibuat di dalam pengukuran agar
+    # string yang dipegang record ikut terhitung, lalu tuple barisnya dibuang
+    del model, rows
+    tracemalloc.start()
+    model = ItemReadModel()
+    rows = make_rows()
+    model.load(rows)
+    del rows
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'Memori read model: {used / 1024 / 1024:.1f} MB per 100k item ({used / n:.0f} byte/item)')
+    
+    started = time.perf_counter()
+    for page in range(1, 101):
+        model.listing('lost', locations[0], page=page)
+    print(f'Listing per halaman (filter lokasi): {(time.perf_counter() - started) * 10:.2f}ms')
+
+@app.cli.command('resume-bulk-jobs')
+def resume_bulk_jobs():
+    """Lanjutkan job operasi massal yang terhenti (di proses ini, sampai selesai)"""
+    job_ids = claim_stale_bulk_jobs()
+    for job_id in job_ids:
+        run_bulk_job(job_id)
+        job = db.session.get(BulkJob, job_id)
+        print(f'Job #{job.id} ({job.action}): {job.status}, {job.processed}/{job.total} diproses, '
+              f'{job.affected} berubah')
+    if not job_ids:
+        print('Tidak ada job yang terhenti')
+
+@app.cli.command('bench-login')
+@click.option('--count', default=100, help='Jumlah verifikasi password')
+def bench_login(count):
+    """Ukur verifikasi password (login) per detik dengan metode hash saat ini"""
+    method = app.config['PASSWORD_HASH_METHOD']
+    workers = app.config['PASSWORD_HASH_WORKERS']
+    stored = generate_password_hash('password-benchmark', method)
+    
+    started = time.perf_counter()
+    check_password_hash(stored, 'password-benchmark')
+    single = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers * 4) as clients:
+        list(clients.map(lambda _: run_password_hash(check_password_hash, stored, 'password-benchmark'),
+                         range(count)))
+    elapsed = time.perf_counter() - started
+    
+    cores = min(workers, os.cpu_count() or 1)
+    print(f'Metode: {method}, {workers} worker hash, {cores} core')
+    print(f'Satu verifikasi: {single * 1000:.1f}ms')
+    print(f'{count / elapsed:.1f} login/detik total, {count / elapsed / cores:.1f} login/detik per core')
+
+# ----- Ekspor statis -----
+# Halaman publik dirender ke HTML + JSON agar pengunjung anonim dilayani dari static
+# hosting/CDN (lihat vercel.json); function hanya untuk login, tulis, dan pencarian.
+# Setiap halaman jadi <path>/index.html + <path>/data.json di folder public/, yang
+# menjadi outputDirectory Vercel: hanya isi folder ini yang disajikan sebagai file.
+def export_write(output, path, filename, content):
+    """Tulis satu file ekspor untuk URL path, menolak path di luar folder output"""
+    root = os.path.abspath(output)
+    folder = os.path.abspath(os.path.join(root, path.strip('/')))
+    if folder != root and not folder.startswith(root + os.sep):
+        print(f'Dilewati (path tidak valid): {path}')
+        return
+    os.makedirs(folder, exist_ok=True)
+    mode = 'wb' if isinstance(content, bytes) else 'w'
+    with open(os.path.join(folder, filename), mode) as f:
+        f.write(content)
+
+def export_remove(output, path):
+    """Hapus file halaman ekspor (bukan foldernya: halaman lain bisa bersarang di dalamnya)"""
+    root = os.path.abspath(output)
+    folder = os.path.abspath(os.path.join(root, path.strip('/')))
+    if not folder.startswith(root + os.sep):
+        return
+    for filename in ('index.html', 'data.json'):
+        if os.path.exists(os.path.join(folder, filename)):
+            os.remove(os.path.join(folder, filename))
+    # Bersihkan folder yang jadi kosong
+    while folder != root and os.path.isdir(folder) and not os.listdir(folder):
+        os.rmdir(folder)
+        folder = os.path.dirname(folder)
+
+def export_page(client, output, path, data):
+    """Render halaman lewat test client (sebagai pengunjung anonim) lalu simpan HTML + JSON"""
+    response = client.get(path)
+    if response.status_code != 200:
+        raise click.ClickException(f'Gagal merender {path}: HTTP {response.status_code}')
+    export_write(output, path, 'index.html', response.data)
+    export_write(output, path, 'data.json', json.dumps(data, ensure_ascii=False))
+
+def listing_dict(item):
+    """Field ringkas item untuk JSON halaman daftar"""
+    return {
+        'id': item.id,
+        'name': item.name,
+        'description': item.description[:100],
+        'location': item.location,
+        'image': url_for('static', filename='uploads/' + item.image) if item.image else None,
+        'timestamp': item.timestamp.isoformat(),
+        'claimed': item.claimed,
+    }
+
+def export_list_pages(client, output, type, location, previous_pages):
+    """Ekspor semua halaman daftar untuk satu tipe (dan lokasi); kembalikan jumlah halaman"""
+    if location:
+        # Lokasi diketik user: pastikan URL-nya tetap tepat satu folder di bawah location/
+        expected = '/'.join(['', 'list', type, 'location', location_slug(location)])
+        if list_url(type, location=location) != expected:
+            print(f'Dilewati (lokasi tidak valid): {location!r}')
+            return 0
+    query = Item.query.filter_by(type=type)
+    if location:
+        query = query.filter_by(location=location)
+    query = query.order_by(Item.timestamp.desc())
+    per_page = app.config['ITEMS_PER_PAGE']
+    
+    pages = 0
+    total = query.count()
+    if total or not location:
+        pages = max(1, -(-total // per_page))
+    for page in range(1, pages + 1):
+        items = query.offset((page - 1) * per_page).limit(per_page).all()
+        data = {'type': type, 'location': location, 'page': page, 'pages': pages, 'total': total,
+                'items': [listing_dict(item) for item in items]}
+        export_page(client, output, list_url(type, page=page, location=location), data)
+    
+    # Hapus halaman yang sudah tidak ada (item berkurang/lokasi kosong)
+    for page in range(pages + 1, previous_pages + 1):
+        export_remove(output, list_url(type, page=page, location=location))
+    return pages
+
+def sync_static_assets(output):
+    """Salin folder static (termasuk uploads) ke output, hanya file yang berubah"""
+    source_root = os.path.join(app.root_path, 'static')
+    target_root = os.path.join(output, 'static')
+    copied = 0
+    for folder, _, files in os.walk(source_root):
+        target_folder = os.path.join(target_root, os.path.relpath(folder, source_root))
+        os.makedirs(target_folder, exist_ok=True)
+        for name in files:
+            source, target = os.path.join(folder, name), os.path.join(target_folder, name)
+            stat = os.stat(source)
+            if os.path.exists(target) and os.path.getmtime(target) == stat.st_mtime \
+                    and os.path.getsize(target) == stat.st_size:
+                continue
+            shutil.copy2(source, target)
+            copied += 1
+    # Gambar item yang sudah dihapus juga dihapus dari ekspor
+    target_uploads = os.path.join(target_root, 'uploads')
+    for name in os.listdir(target_uploads):
+        if not os.path.exists(os.path.join(app.config['UPLOAD_FOLDER'], name)):
+            os.remove(os.path.join(target_uploads, name))
+    return copied
+
+@app.cli.command('export-static')
+@click.option('--output', default=None, help='Folder output (default: STATIC_EXPORT_FOLDER)')
+@click.option('--full', is_flag=True, help='Render ulang semua halaman')
+def export_static(output, full):
+    """Ekspor halaman publik ke HTML + JSON statis, hanya halaman yang terpengaruh perubahan"""
+    output = output or app.config['STATIC_EXPORT_FOLDER']
+    manifest_path = os.path.join(output, 'data', 'manifest.json')
+    manifest = None
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    
+    # url_for butuh request context; halaman dirender sebagai pengunjung anonim
+    with app.test_request_context():
+        latest_seq = db.session.query(func.max(ItemChange.seq)).scalar() or 0
+        current = {item_id: (type, location) for item_id, type, location
+                   in db.session.query(Item.id, Item.type, Item.location)}
+        locations = sorted({location for _, location in current.values()})
+        all_combos = {(type, None) for type in ('lost', 'found')} | set(current.values())
+        
+        previous = {int(item_id): tuple(value) for item_id, value in manifest['items'].items()} \
+            if manifest else {}
+        previous_pages = manifest['pages'] if manifest else {}
+        if full or manifest is None:
+            changed_ids, deleted_ids = set(current), set(previous) - set(current)
+            combos = all_combos | set(previous.values())
+        else:
+            changed = {item_id for (item_id,) in db.session.query(ItemChange.item_id)
+                       .filter(ItemChange.seq > manifest['seq']).distinct()}
+            changed_ids = changed & set(current)
+            deleted_ids = (changed - set(current)) & set(previous)
+            if set(locations) != set(manifest['locations']):
+                # Dropdown filter lokasi ada di setiap halaman daftar: render ulang semuanya
+                combos = all_combos | set(previous.values())
+            else:
+                combos = set()
+                for item_id in changed:
+                    for type, location in filter(None, (previous.get(item_id), current.get(item_id))):
+                        combos.update({(type, None), (type, location)})
+        
+        client = app.test_client()
+        rendered = 0
+        if full or manifest is None or changed_ids or deleted_ids or combos:
+            export_page(client, output, url_for('index'), {
+                type: [listing_dict(item) for item in Item.query.filter_by(type=type)
+                       .order_by(Item.timestamp.desc()).limit(3)]
+                for type in ('lost', 'found')
+            })
+            rendered += 1
+        
+        pages = dict(previous_pages)
+        for type, location in sorted(combos, key=lambda combo: (combo[0], combo[1] or '')):
+            key = f'{type}|{location or ""}'
+            count = export_list_pages(client, output, type, location, previous_pages.get(key, 0))
+            rendered += count
+            if count:
+                pages[key] = count
+            else:
+                pages.pop(key, None)
+        
+        for item_id in sorted(changed_ids):
+            item = db.session.get(Item, item_id)
+            export_page(client, output, url_for('item_detail', item_id=item_id),
+                        dict(item_to_dict(item), id=item_id))
+            rendered += 1
+        for item_id in deleted_ids:
+            export_remove(output, url_for('item_detail', item_id=item_id))
+        
+        copied = sync_static_assets(output)
+        export_write(output, '/data', 'manifest.json', json.dumps({
+            'seq': latest_seq,
+            'generated_at': datetime.utcnow().isoformat(),
+            'items': {str(item_id): list(value) for item_id, value in current.items()},
+            'locations': locations,
+            'pages': pages,
+        }, ensure_ascii=False))
+        
+        print(f'Ekspor ke {output}: {rendered} halaman dirender, {len(deleted_ids)} item dihapus, '
+              f'{copied} file static disalin (seq {latest_seq})')
+
 # ===================== INITIAL SETUP =====================
+# Kolom yang ditambahkan setelah tabel dibuat (db.create_all tidak mengubah tabel lama)
+SCHEMA_UPGRADES = [
+    ('item', 'seq', 'INTEGER NOT NULL DEFAULT 0',
+     ['UPDATE item SET seq = id', 'CREATE INDEX IF NOT EXISTS ix_item_seq ON item (seq)']),
+    ('item', 'updated_at', 'DATETIME',
+     ['UPDATE item SET updated_at = timestamp',
+      "INSERT INTO item_change (seq, item_id, op, changed_at) "
+      "SELECT seq, id, 'insert', timestamp FROM item ORDER BY seq"]),
+    ('item', 'claimed', 'BOOLEAN NOT NULL DEFAULT 0', []),
+    # Job lama tidak menyimpan pilihan item, jadi tidak bisa dilanjutkan
+    ('bulk_job', 'item_ids', 'TEXT',
+     ["UPDATE bulk_job SET status = 'failed', error = 'Terhenti sebelum selesai' "
+      "WHERE status IN ('pending', 'running')"]),
+    ('bulk_job', 'new_location', 'VARCHAR(100)', []),
+    ('bulk_job', 'last_id', 'INTEGER NOT NULL DEFAULT 0', []),
+    ('bulk_job', 'heartbeat_at', 'DATETIME', []),
+]
+
+def upgrade_schema():
+    """Tambahkan kolom baru ke tabel yang sudah ada"""
+    inspector = db.inspect(db.engine)
+    for table, column, ddl, statements in SCHEMA_UPGRADES:
+        if column in {c['name'] for c in inspector.get_columns(table)}:
+            continue
+        db.session.execute(text(f'ALTER TABLE {table} ADD COLUMN {column} {ddl}'))
+        for statement in statements:
+            db.session.execute(text(statement))
+    db.session.commit()
+
 def create_tables():
     """Buat tabel database"""
     with app.app_context():
         db.create_all()
+        upgrade_schema()
         
         # Buat admin default jika belum ada
         if not User.query.filter_by(username='admin').first():
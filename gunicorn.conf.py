@@ -0,0 +1,47 @@
+# ===================== KONFIGURASI GUNICORN =====================
+# Dipakai otomatis oleh `gunicorn app:app` (gunicorn membaca gunicorn.conf.py
+# dari direktori kerja). Semua nilai bisa dioverride lewat environment variable.
+import multiprocessing
+import os
+
+cpu_count = multiprocessing.cpu_count()
+
+bind = '0.0.0.0:' + os.environ.get('PORT', '8000')
+
+# Worker class: 'gthread' (default, tanpa dependency tambahan), atau 'gevent' jika
+# diminta eksplisit lewat GUNICORN_WORKER_CLASS=gevent dan paketnya terinstall
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+if worker_class == 'gevent':
+    try:
+        import gevent  # noqa: F401
+    except ImportError:
+        print("Peringatan: gevent tidak terinstall. Menggunakan worker gthread.")
+        worker_class = 'gthread'
+
+# Upload + resize gambar bersifat I/O-bound untuk request thread (resize
+# dijalankan di process pool terpisah), jadi cukup sedikit proses dengan
+# banyak thread. SQLite hanya mengizinkan satu writer, proses dibatasi.
+workers = int(os.environ.get('WEB_CONCURRENCY', min(cpu_count + 1, 4)))
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 200))
+
+# Upload lambat dari koneksi mobile jangan sampai dibunuh worker timeout
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+graceful_timeout = 30
+keepalive = 5
+
+# Restart worker berkala untuk mencegah memory leak dari Pillow
+max_requests = 1000
+max_requests_jitter = 100
+
+# Jangan preload app: process pool gambar dibuat per worker setelah fork
+preload_app = False
+
+accesslog = '-'
+errorlog = '-'
+
+
+def worker_exit(server, worker):
+    """Tutup process pool gambar saat worker berhenti"""
+    from app import shutdown_image_pool
+    shutdown_image_pool()
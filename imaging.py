@@ -0,0 +1,16 @@
+"""Pekerjaan Pillow yang dijalankan di process pool gambar.
+
+Sengaja dipisah dari app.py: proses worker pool (forkserver/spawn) hanya perlu
+mengimpor modul kecil ini, bukan seluruh aplikasi Flask beserta konfigurasinya.
+"""
+from PIL import Image
+
+
+def resize_image(filepath, output_size):
+    """Resize gambar di tempat (dijalankan di process pool, harus top-level agar bisa di-pickle)"""
+    with Image.open(filepath) as img:
+        # JPEG: decode langsung di skala kecil (1/2, 1/4, 1/8), jauh lebih cepat untuk foto HP
+        img.draft(None, output_size)
+        img.thumbnail(output_size)
+        img.save(filepath)
+    return filepath
@@ -0,0 +1,173 @@
+"""Load test campuran baca/upload untuk server yang sedang berjalan.
+
+Contoh:
+    gunicorn -c gunicorn.conf.py app:app
+    python loadtest.py --url http://127.0.0.1:8000 --requests 200 --upload-ratio 0.2
+
+Hanya memakai standard library (+ Pillow untuk membuat gambar uji jika ada).
+Item yang dibuat selama tes dihapus lagi jika login sebagai admin.
+"""
+import argparse
+import http.cookiejar
+import io
+import random
+import re
+import secrets
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+CSRF_RE = re.compile(r'name="csrf_token"[^>]*value="([^"]+)"')
+ITEM_RE = re.compile(r'/item/(\d+)')
+
+
+def make_image(size=(1600, 1200)):
+    """Buat gambar JPEG uji (mirip foto HP) di memori"""
+    if not HAS_PIL:
+        return b'\xff\xd8\xff\xe0' + secrets.token_bytes(512 * 1024)
+    img = Image.effect_noise(size, 16).convert('RGB')
+    buf = io.BytesIO()
+    img.save(buf, 'JPEG', quality=85)
+    return buf.getvalue()
+
+
+def encode_multipart(fields, files):
+    """Encode form multipart/form-data sederhana"""
+    boundary = secrets.token_hex(16)
+    body = io.BytesIO()
+    for name, value in fields.items():
+        body.write(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode())
+    for name, (filename, data, content_type) in files.items():
+        body.write(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; '
+                   f'filename="{filename}"\r\nContent-Type: {content_type}\r\n\r\n'.encode())
+        body.write(data)
+        body.write(b'\r\n')
+    body.write(f'--{boundary}--\r\n'.encode())
+    return body.getvalue(), f'multipart/form-data; boundary={boundary}'
+
+
+class Client:
+    """Satu sesi browser (cookie + CSRF) per thread"""
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip('/')
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+
+    def get(self, path):
+        with self.opener.open(self.base_url + path, timeout=60) as resp:
+            return resp.read().decode('utf-8', 'replace')
+
+    def post(self, path, data, content_type='application/x-www-form-urlencoded'):
+        if isinstance(data, dict):
+            data = urllib.parse.urlencode(data).encode()
+        req = urllib.request.Request(self.base_url + path, data=data,
+                                     headers={'Content-Type': content_type})
+        with self.opener.open(req, timeout=60) as resp:
+            return resp.read().decode('utf-8', 'replace')
+
+    def csrf(self, path):
+        match = CSRF_RE.search(self.get(path))
+        return match.group(1) if match else ''
+
+    def login(self, username, password):
+        token = self.csrf('/login')
+        self.post('/login', {'csrf_token': token, 'username': username, 'password': password})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--upload-ratio', type=float, default=0.2)
+    parser.add_argument('--username', default='admin')
+    parser.add_argument('--password', default='admin123')
+    args = parser.parse_args()
+
+    image = make_image()
+    local = threading.local()
+    results = {'read': [], 'upload': []}
+    errors = []
+    lock = threading.Lock()
+
+    def client():
+        if not hasattr(local, 'client'):
+            local.client = Client(args.url)
+            local.client.login(args.username, args.password)
+        return local.client
+
+    def read(c):
+        path = random.choice(['/', '/list/lost', '/list/found', '/list/lost?page=2'])
+        c.get(path)
+
+    def upload(c):
+        token = c.csrf('/add')
+        body, content_type = encode_multipart(
+            {'csrf_token': token, 'type': random.choice(['lost', 'found']),
+             'name': 'Loadtest ' + secrets.token_hex(3), 'description': 'Item load test',
+             'location': 'kantin', 'contact': '081234567890'},
+            {'image': ('foto.jpg', image, 'image/jpeg')})
+        c.post('/add', body, content_type)
+
+    def run(kind):
+        start = time.perf_counter()
+        try:
+            c = client()
+            (upload if kind == 'upload' else read)(c)
+        except Exception as e:
+            with lock:
+                errors.append(f'{kind}: {e}')
+            return
+        with lock:
+            results[kind].append(time.perf_counter() - start)
+
+    kinds = ['upload' if random.random() < args.upload_ratio else 'read'
+             for _ in range(args.requests)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(run, kinds))
+    elapsed = time.perf_counter() - started
+
+    print(f'{args.requests} request dalam {elapsed:.2f}s '
+          f'({args.requests / elapsed:.1f} req/s), {len(errors)} error')
+    for kind, latencies in results.items():
+        if not latencies:
+            continue
+        latencies.sort()
+        p95 = latencies[int(len(latencies) * 0.95) - 1] if len(latencies) > 1 else latencies[0]
+        print(f'  {kind:6s} n={len(latencies):4d} '
+              f'median={statistics.median(latencies) * 1000:7.1f}ms '
+              f'p95={p95 * 1000:7.1f}ms max={latencies[-1] * 1000:7.1f}ms')
+    for error in errors[:5]:
+        print('  ' + error)
+
+    # Bersihkan item hasil load test (hanya admin yang boleh hapus)
+    cleanup = Client(args.url)
+    cleanup.login(args.username, args.password)
+    deleted = 0
+    try:
+        for type_ in ('lost', 'found'):
+            ids = set(ITEM_RE.findall(cleanup.get(f'/list/{type_}?search=Loadtest')))
+            while ids:
+                for item_id in ids:
+                    cleanup.post(f'/delete/{item_id}', {})
+                    deleted += 1
+                ids = set(ITEM_RE.findall(cleanup.get(f'/list/{type_}?search=Loadtest')))
+    except urllib.error.HTTPError as e:
+        print(f'Gagal menghapus item load test: {e}')
+    print(f'{deleted} item load test dihapus')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+// Upload foto bertahap (resumable) untuk input file dengan atribut data-chunked-upload.
+// Foto dikirim per chunk sebelum form disubmit, jadi form hanya membawa upload_id.
+// Jika koneksi putus, upload dilanjutkan dari offset terakhir yang diterima server.
+document.addEventListener('DOMContentLoaded', function() {
+    document.querySelectorAll('input[type="file"][data-chunked-upload]').forEach(setupChunkedUpload);
+});
+
+function setupChunkedUpload(fileInput) {
+    const form = fileInput.form;
+    const createUrl = fileInput.dataset.chunkedUpload;
+    const csrfInput = form.querySelector('input[name="csrf_token"]');
+    const csrfToken = csrfInput ? csrfInput.value : '';
+    const status = document.createElement('small');
+    status.className = 'd-block mt-1';
+    fileInput.insertAdjacentElement('afterend', status);
+
+    let uploadIdInput = form.querySelector('input[name="upload_id"]');
+    if (!uploadIdInput) {
+        uploadIdInput = document.createElement('input');
+        uploadIdInput.type = 'hidden';
+        uploadIdInput.name = 'upload_id';
+        form.appendChild(uploadIdInput);
+    }
+
+    let uploading = false;
+
+    function showStatus(text, className) {
+        status.className = 'd-block mt-1 ' + (className || 'text-muted');
+        status.textContent = text;
+    }
+
+    function sleep(ms) {
+        return new Promise(resolve => setTimeout(resolve, ms));
+    }
+
+    async function request(method, url, body, headers) {
+        const response = await fetch(url, {
+            method: method,
+            body: body,
+            credentials: 'same-origin',
+            headers: Object.assign({'X-CSRFToken': csrfToken}, headers || {})
+        });
+        const data = await response.json().catch(() => ({}));
+        return {response: response, data: data};
+    }
+
+    // Ulangi request saat jaringan putus/5xx, dengan jeda yang makin lama
+    async function withRetry(fn) {
+        for (let attempt = 0; ; attempt++) {
+            try {
+                const result = await fn();
+                if (result.response.status < 500) {
+                    return result;
+                }
+            } catch (err) {
+                // Jaringan putus: coba lagi
+            }
+            if (attempt >= 8) {
+                throw new Error('Koneksi terputus, silakan pilih ulang foto untuk melanjutkan');
+            }
+            showStatus('Koneksi terputus, mencoba lagi...', 'text-warning');
+            await sleep(Math.min(1000 * Math.pow(2, attempt), 30000));
+        }
+    }
+
+    async function upload(file) {
+        // Upload yang sama (file, ukuran, tanggal) bisa dilanjutkan setelah reload halaman
+        const storageKey = 'chunked-upload:' + file.name + ':' + file.size + ':' + file.lastModified;
+        let uploadId = localStorage.getItem(storageKey);
+        let offset = 0;
+        let chunkSize = 1024 * 1024;
+
+        if (uploadId) {
+            const result = await withRetry(() => request('GET', createUrl + '/' + uploadId));
+            if (result.response.ok) {
+                offset = result.data.offset;
+            } else {
+                uploadId = null;
+            }
+        }
+        if (!uploadId) {
+            const result = await withRetry(() => request('POST', createUrl,
+                JSON.stringify({filename: file.name, length: file.size}),
+                {'Content-Type': 'application/json'}));
+            if (!result.response.ok) {
+                throw new Error(result.data.error || 'Gagal memulai upload');
+            }
+            uploadId = result.data.id;
+            chunkSize = result.data.chunk_size || chunkSize;
+            localStorage.setItem(storageKey, uploadId);
+        }
+
+        while (offset < file.size) {
+            showStatus('Mengunggah foto... ' + Math.floor(offset * 100 / file.size) + '%');
+            const chunk = file.slice(offset, offset + chunkSize);
+            const result = await withRetry(() => request('PATCH', createUrl + '/' + uploadId, chunk,
+                {'Content-Type': 'application/offset+octet-stream', 'Upload-Offset': String(offset)}));
+            if (result.response.ok || result.response.status === 409) {
+                // 409: offset server berbeda (chunk sebelumnya sebagian diterima), lanjut dari sana
+                offset = result.data.offset;
+            } else {
+                throw new Error(result.data.error || 'Gagal mengunggah foto');
+            }
+        }
+
+        showStatus('Memproses foto...');
+        const result = await withRetry(() => request('POST', createUrl + '/' + uploadId + '/finalize'));
+        if (!result.response.ok) {
+            localStorage.removeItem(storageKey);
+            throw new Error(result.data.error || 'Gagal memproses foto');
+        }
+        localStorage.removeItem(storageKey);
+        return uploadId;
+    }
+
+    fileInput.addEventListener('change', async function() {
+        uploadIdInput.value = '';
+        if (!fileInput.files.length || typeof fetch === 'undefined') {
+            return;
+        }
+        const file = fileInput.files[0];
+        uploading = true;
+        try {
+            uploadIdInput.value = await upload(file);
+            // Kosongkan input file agar submit form tidak mengirim ulang foto
+            fileInput.value = '';
+            showStatus('✅ Foto ' + file.name + ' berhasil diunggah', 'text-success');
+        } catch (err) {
+            showStatus('⚠️ ' + err.message, 'text-danger');
+            fileInput.value = '';
+        } finally {
+            uploading = false;
+        }
+    });
+
+    // Jangan submit selama foto masih diunggah
+    form.addEventListener('submit', function(e) {
+        if (uploading) {
+            e.preventDefault();
+            e.stopImmediatePropagation();
+            alert('⚠️ Tunggu sampai foto selesai diunggah');
+        }
+    }, true);
+}